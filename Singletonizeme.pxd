@@ -0,0 +1,42 @@
+# Cython declarations for Singletonizeme.py (augmenting .pxd).
+#
+# The module stays plain Python; when it is compiled with ``setup.py`` these
+# declarations turn the shared state and the hot path into C-level code.
+
+cdef object _MISSING
+cdef object _bootstrap_lock
+
+
+cdef dict _WRAPPERS
+
+
+cdef class _SingletonWrapper:
+    cdef object _cls
+    cdef object _instance
+    cdef object _lock
+    cdef dict __dict__
+
+
+cdef class _LaxWrapper(_SingletonWrapper):
+    cdef object _create(self, tuple args, dict kwargs)
+
+
+cdef class _StrictWrapper(_SingletonWrapper):
+    cdef object _create(self, tuple args, dict kwargs)
+
+
+cdef class _ThreadSafeLaxWrapper(_LaxWrapper):
+    pass
+
+
+cdef class _ThreadSafeStrictWrapper(_StrictWrapper):
+    pass
+
+
+cdef object _ensure_lock(_SingletonWrapper wrapper)
+cdef object _strict_error(object cls)
+
+
+cdef class Singleton:
+    cdef public bint thread_safe
+    cdef public bint strict
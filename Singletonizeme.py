@@ -50,11 +50,160 @@ Usage Example:
 -------------------------------------------------------------------------------
 """
 
-import threading
-from typing import Any, Type, TypeVar, Dict
+import _thread
+import functools
+from typing import Any, Callable, Type, TypeVar
 
 T = TypeVar("T")
 
+# Sentinel for "no instance yet", so a single slot read both tests for and
+# fetches the instance.
+_MISSING = object()
+
+# Only guards the lazy creation of the per-class locks (see _ensure_lock).
+_bootstrap_lock = _thread.allocate_lock()
+
+
+def _ensure_lock(wrapper):
+    """Return ``wrapper``'s lock, allocating it on first use."""
+    _bootstrap_lock.acquire()
+    try:
+        if wrapper._lock is None:
+            wrapper._lock = _thread.allocate_lock()
+    finally:
+        _bootstrap_lock.release()
+    return wrapper._lock
+
+
+def _strict_error(cls: Type[T]) -> RuntimeError:
+    return RuntimeError(
+        f"Attempt to create another instance of singleton class '{cls.__name__}'"
+    )
+
+
+class _SingletonWrapper:
+    """
+    Callable returned by the decorator in place of the decorated class.
+
+    ``thread_safe`` and ``strict`` are fixed at decoration time, so instead
+    of testing them on every instantiation the decorator picks one of the
+    subclasses below: ``strict`` selects the ``__call__`` (the hot path) and
+    ``thread_safe`` selects ``_create`` (the path that builds the instance).
+
+    The instance lives in the wrapper's ``_instance`` slot rather than on the
+    decorated class, so checking for it needs no lookup, immutable and
+    extension types can be decorated, and the instance is released together
+    with the decorated name.
+
+    Thread-safe wrappers carry their own ``_lock``, so unrelated singletons
+    never serialise on each other and finding the lock needs no lookup. It
+    is only allocated the first time the instance is created, so a class
+    that is never instantiated never pays for one.
+    """
+
+    # __dict__ holds the identity copied from the decorated class
+    # (__name__, __qualname__, __doc__, __module__, __wrapped__), so that the
+    # decorated name still looks like the class to help(), logging and
+    # registries.
+    __slots__ = ("_cls", "_instance", "_lock", "__dict__")
+
+    def __init__(self, cls: Type[T]):
+        self._cls = cls
+        self._instance = _MISSING
+        self._lock = None
+        functools.update_wrapper(self, cls, updated=())  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f"<Singleton wrapper of {self._cls!r}>"
+
+    def __call__(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def _reset(self) -> None:
+        self._instance = _MISSING
+
+
+class _LaxWrapper(_SingletonWrapper):
+    """``thread_safe=False, strict=False``."""
+
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        inst = self._instance
+        return inst if inst is not _MISSING else self._create(args, kwargs)
+
+    def _create(self, args, kwargs):
+        inst = self._instance = self._cls(*args, **kwargs)
+        return inst
+
+
+class _StrictWrapper(_SingletonWrapper):
+    """``thread_safe=False, strict=True``."""
+
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs) -> Any:
+        if self._instance is not _MISSING:
+            raise _strict_error(self._cls)
+        return self._create(args, kwargs)
+
+    def _create(self, args, kwargs):
+        inst = self._instance = self._cls(*args, **kwargs)
+        return inst
+
+
+# The thread-safe wrappers reuse the __call__ above and only add double-checked
+# locking to _create(). The unlocked read in __call__ is safe because a single
+# slot read or store is atomic, and an instance is only stored
+# once its constructor has returned. The lock only keeps two threads from both
+# running the constructor, so an existing singleton is returned without ever
+# touching it.
+
+
+class _ThreadSafeLaxWrapper(_LaxWrapper):
+    """``thread_safe=True, strict=False``."""
+
+    __slots__ = ()
+
+    def _create(self, args, kwargs):
+        cls = self._cls
+        lock = self._lock or _ensure_lock(self)
+        lock.acquire()
+        try:
+            inst = self._instance
+            if inst is _MISSING:
+                inst = self._instance = cls(*args, **kwargs)
+        finally:
+            lock.release()
+        return inst
+
+
+class _ThreadSafeStrictWrapper(_StrictWrapper):
+    """``thread_safe=True, strict=True``."""
+
+    __slots__ = ()
+
+    def _create(self, args, kwargs):
+        cls = self._cls
+        lock = self._lock or _ensure_lock(self)
+        lock.acquire()
+        try:
+            if self._instance is not _MISSING:
+                raise _strict_error(cls)
+            inst = self._instance = cls(*args, **kwargs)
+        finally:
+            lock.release()
+        return inst
+
+
+# Wrapper type for each (thread_safe, strict) configuration.
+_WRAPPERS = {
+    (False, False): _LaxWrapper,
+    (False, True): _StrictWrapper,
+    (True, False): _ThreadSafeLaxWrapper,
+    (True, True): _ThreadSafeStrictWrapper,
+}
+
 
 class Singleton:
     """
@@ -71,34 +220,30 @@ class Singleton:
             pass
     """
 
-    # Dictionary to store one instance per decorated class
-    _instances: Dict[Type, Any] = {}
-    _lock = threading.Lock()
-
     def __init__(self, thread_safe: bool = True, strict: bool = False):
-        self.thread_safe = thread_safe
-        self.strict = strict
+        self.thread_safe = bool(thread_safe)
+        self.strict = bool(strict)
 
-    def __call__(self, cls: Type[T]) -> Type[T]:
+    def __call__(self, cls: Type[T]) -> Callable[..., T]:
         """
         Called when the decorator is applied to a class.
         Returns a wrapped class that enforces singleton behavior.
         """
+        if not isinstance(cls, type):
+            raise TypeError(f"@Singleton can only decorate classes, not {cls!r}")
+
+        wrapper_type = _WRAPPERS[self.thread_safe, self.strict]
+        return wrapper_type(cls)
 
-        def wrapper(*args, **kwargs) -> T:
-            if cls not in Singleton._instances:
-                if self.thread_safe:
-                    with Singleton._lock:
-                        if cls not in Singleton._instances:
-                            Singleton._instances[cls] = cls(*args, **kwargs)
-                else:
-                    Singleton._instances[cls] = cls(*args, **kwargs)
-            else:
-                if self.strict:
-                    raise RuntimeError(
-                        f"Attempt to create another instance of singleton class '{cls.__name__}'"
-                    )
-
-            return Singleton._instances[cls]
-
-        return wrapper
+    @staticmethod
+    def reset(cls) -> None:
+        """
+        Forget the instance of a decorated class, so that the next call
+        creates a new one. Mainly intended for tests.
+
+        ``cls`` is the decorated class, i.e. the name the decorator was
+        applied to.
+        """
+        if not isinstance(cls, _SingletonWrapper):
+            raise TypeError(f"{cls!r} is not a class decorated with @Singleton")
+        cls._reset()
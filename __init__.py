@@ -51,4 +51,4 @@ Usage Example:
 """
 
 from .Singletonizeme import Singleton
-__all__ = ["Singletonizeme"]
\ No newline at end of file
+__all__ = ["Singleton"]
\ No newline at end of file
@@ -1,5 +1,8 @@
 from Singletonizeme import Singleton
-import datetime
+import atexit
+import sys
+import threading
+import time
 
 
 @Singleton(thread_safe=True, strict=False)
@@ -13,28 +16,76 @@ class AppLogger():
     Args:
         logfile (str): Path to the log file.
         mode (str): File writing mode ('a' for append, 'w' for overwrite).
+        flush_bytes (int): Amount of buffered output after which the log file
+            is flushed; it is always flushed on close().
     """
 
-    def __init__(self, logfile: str = "app.log", mode: str = "a"):
+    # @Singleton wraps the class rather than subclassing it, so __slots__
+    # applies to the instance as-is and no per-instance __dict__ is created.
+    __slots__ = (
+        "logfile",
+        "mode",
+        "flush_bytes",
+        "_bytes_since_flush",
+        "_last_ts_epoch",
+        "_ts_prefix",
+        "_lock",
+        "_file",
+    )
+
+    def __init__(self, logfile: str = "app.log", mode: str = "a", flush_bytes: int = 4096):
         self.logfile = logfile
         self.mode = mode
+        self.flush_bytes = flush_bytes
+        self._bytes_since_flush = 0
+
+        # Timestamps have one-second resolution, so the "[timestamp] "
+        # prefix is cached and only rebuilt when the second changes.
+        self._last_ts_epoch = -1
+        self._ts_prefix = ""
+
+        # Keeps lines from concurrent writers from interleaving.
+        self._lock = threading.Lock()
 
-        # Open the file once, ensuring the same file handle is reused.
-        self._file = open(self.logfile, self.mode, encoding="utf-8")
+        # Open the file once, ensuring the same file handle is reused. Writes
+        # are block-buffered and flushed in batches rather than per line; the
+        # file is binary because write() encodes each line itself.
+        self._file = open(self.logfile, self.mode + "b", buffering=8192)
+        atexit.register(self.close)
         self.write("Logger initialized.")
 
     def write(self, message: str):
-        """Write a timestamped message to both console and log file."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted = f"[{timestamp}] {message}"
-        print(formatted)
-        self._file.write(formatted + "\n")
-        self._file.flush()
+        """
+        Write a timestamped message to both console and log file.
+
+        The console copy goes through sys.stdout as text, so it follows the
+        console's encoding and newline handling; the file gets the line
+        encoded as UTF-8.
+        """
+        with self._lock:
+            sec = int(time.time())
+            if sec != self._last_ts_epoch:
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+                self._ts_prefix = f"[{timestamp}] "
+                self._last_ts_epoch = sec
+
+            line = f"{self._ts_prefix}{message}\n"
+            sys.stdout.write(line)
+            data = line.encode("utf-8")
+            self._file.write(data)
+
+            self._bytes_since_flush += len(data)
+            if self._bytes_since_flush >= self.flush_bytes:
+                self._file.flush()
+                self._bytes_since_flush = 0
 
     def close(self):
-        """Close the log file (should be called at program exit)."""
+        """Flush and close the log file (also called automatically at program exit)."""
+        if self._file.closed:
+            return
         self.write("Logger closed.")
         self._file.close()
+        atexit.unregister(self.close)
 
 
 # --- Example usage ----------------------------------------------------------
@@ -0,0 +1,36 @@
+"""
+Build script for Singletonizeme.
+
+When Cython is available, Singletonizeme.py is compiled in place into an
+extension module of the same name, using the declarations in
+Singletonizeme.pxd. Python prefers the extension over the .py file at import
+time, so ``from Singletonizeme import Singleton`` picks up the compiled
+version whenever it was built and falls back to the pure-Python module
+otherwise. Without Cython, or if compiling fails, a pure-Python package is
+installed.
+"""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("Singletonizeme", ["Singletonizeme.py"], optional=True)],
+        language_level=3,
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "initializedcheck": False,
+        },
+    )
+
+setup(
+    name="singletonizeme",
+    version="1.0.0",
+    py_modules=["Singletonizeme"],
+    python_requires=">=3.8",
+    ext_modules=ext_modules,
+)